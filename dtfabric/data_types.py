@@ -3,23 +3,35 @@
 
 from __future__ import unicode_literals
 
-import abc
+import sys
 import typing
 
-from typing import Dict, List, Optional, Union  # pylint: disable=unused-import
+from typing import (  # pylint: disable=unused-import
+    Dict, Iterable, List, Optional, Sequence, Tuple, Union)
 
 from dtfabric import definitions
 
 
+# Shared empty aliases, used instead of allocating an empty list per instance.
+_EMPTY_TUPLE: 'Sequence[str]' = ()
+
+
 class DataTypeDefinition(object):
   """Data type definition interface.
 
+  Registered data type definitions are compared by type and name, other
+  definitions, such as structure members, only by identity. Since equality
+  changes when a definition is registered, definitions should not be added
+  to sets or used as dictionary keys before they are registered.
+
   Attributes:
-    aliases (list[str]): aliases.
+    aliases (Sequence[str]): aliases, an empty tuple if not defined.
     byte_order (str): byte-order the data type.
     description (str): description.
     name (str): name.
-    urls (list[str]): URLs.
+    registered (bool): True if the definition was registered as a top-level
+        definition in a definitions registry.
+    urls (list[str]): URLs or None if not defined.
   """
 
   # Note that redundant-returns-doc is broken for pylint 1.7.x for abstract
@@ -30,6 +42,9 @@ class DataTypeDefinition(object):
 
   _IS_COMPOSITE: 'bool' = False
 
+  __slots__ = (
+      'aliases', 'byte_order', 'description', 'name', 'registered', 'urls')
+
   def __init__(
       self, name: 'str', aliases: 'Optional[List[str]]' = None,
       description: 'Optional[str]' = None,
@@ -43,18 +58,50 @@ class DataTypeDefinition(object):
       urls (Optional[list[str]]): URLs.
     """
     super(DataTypeDefinition, self).__init__()
-    self.aliases: 'List[str]' = aliases or []
+    self.aliases: 'Sequence[str]' = aliases if aliases else _EMPTY_TUPLE
     self.description: 'Union[str, None]' = description
     self.name: 'str' = name
+    self.registered: 'bool' = False
     self.urls: 'Union[List[str], None]' = urls
 
-  @abc.abstractmethod
+  def __eq__(self, other: 'object') -> 'bool':
+    """Determines if the data type definition is equal to another.
+
+    Args:
+      other (object): object to compare to.
+
+    Returns:
+      bool: True if the other object is the same data type definition or
+          both are registered data type definitions of the same type and
+          with the same name, False otherwise.
+    """
+    if self is other:
+      return True
+
+    if not self.registered or type(self) is not type(other):
+      return False
+
+    other = typing.cast('DataTypeDefinition', other)
+    return other.registered and self.name == other.name
+
+  def __hash__(self) -> 'int':
+    """Retrieves the hash of the data type definition.
+
+    Returns:
+      int: hash of the type indicator and name.
+    """
+    return hash((self.TYPE_INDICATOR, self.name))
+
   def GetByteSize(self) -> 'Union[int, None]':
     """Retrieves the byte size of the data type definition.
 
     Returns:
       int: data type size in bytes or None if size cannot be determined.
+
+    Raises:
+      NotImplementedError: if the subclass does not implement the method.
     """
+    raise NotImplementedError()
 
   def IsComposite(self) -> 'bool':
     """Determines if the data type is composite.
@@ -78,6 +125,8 @@ class StorageDataTypeDefinition(DataTypeDefinition):
   # methods.
   # pylint: disable=redundant-returns-doc
 
+  __slots__ = ()
+
   def __init__(
       self, name: 'str', aliases: 'Optional[List[str]]' = None,
       description: 'Optional[str]' = None,
@@ -94,13 +143,16 @@ class StorageDataTypeDefinition(DataTypeDefinition):
         name, aliases=aliases, description=description, urls=urls)
     self.byte_order: 'str' = definitions.BYTE_ORDER_NATIVE
 
-  @abc.abstractmethod
   def GetByteSize(self) -> 'Union[int, None]':
     """Retrieves the byte size of the data type definition.
 
     Returns:
       int: data type size in bytes or None if size cannot be determined.
+
+    Raises:
+      NotImplementedError: if the subclass does not implement the method.
     """
+    raise NotImplementedError()
 
 
 class FixedSizeDataTypeDefinition(StorageDataTypeDefinition):
@@ -111,6 +163,8 @@ class FixedSizeDataTypeDefinition(StorageDataTypeDefinition):
     units (str): units of the size of the data type.
   """
 
+  __slots__ = ('size', 'units')
+
   def __init__(
       self, name: 'str', aliases: 'Optional[List[str]]' = None,
       description: 'Optional[str]' = None,
@@ -152,6 +206,8 @@ class BooleanDefinition(FixedSizeDataTypeDefinition):
 
   TYPE_INDICATOR: 'Union[str, None]' = definitions.TYPE_INDICATOR_BOOLEAN
 
+  __slots__ = ('false_value', 'true_value')
+
   def __init__(
       self, name: 'str', aliases: 'Optional[List[str]]' = None,
       description: 'Optional[str]' = None, false_value: 'int' = 0,
@@ -176,6 +232,8 @@ class CharacterDefinition(FixedSizeDataTypeDefinition):
 
   TYPE_INDICATOR: 'Union[str, None]' = definitions.TYPE_INDICATOR_CHARACTER
 
+  __slots__ = ()
+
 
 class FloatingPointDefinition(FixedSizeDataTypeDefinition):
   """Floating point data type definition."""
@@ -183,6 +241,8 @@ class FloatingPointDefinition(FixedSizeDataTypeDefinition):
   TYPE_INDICATOR: 'Union[str, None]' = (
       definitions.TYPE_INDICATOR_FLOATING_POINT)
 
+  __slots__ = ()
+
 
 class IntegerDefinition(FixedSizeDataTypeDefinition):
   """Integer data type definition.
@@ -195,6 +255,8 @@ class IntegerDefinition(FixedSizeDataTypeDefinition):
 
   TYPE_INDICATOR: 'Union[str, None]' = definitions.TYPE_INDICATOR_INTEGER
 
+  __slots__ = ('format', 'maximum_value', 'minimum_value')
+
   def __init__(
       self, name: 'str', aliases: 'Optional[List[str]]' = None,
       description: 'Optional[str]' = None,
@@ -227,6 +289,8 @@ class UUIDDefinition(FixedSizeDataTypeDefinition):
 
   _IS_COMPOSITE: 'bool' = True
 
+  __slots__ = ()
+
   def __init__(
       self, name: 'str', aliases: 'Optional[List[str]]' = None,
       description: 'Optional[str]' = None,
@@ -257,6 +321,8 @@ class PaddingDefinition(StorageDataTypeDefinition):
 
   TYPE_INDICATOR: 'Union[str, None]' = definitions.TYPE_INDICATOR_PADDING
 
+  __slots__ = ('alignment_size',)
+
   def __init__(
       self, name: 'str', aliases: 'Optional[List[str]]' = None,
       alignment_size: 'Optional[int]' = None,
@@ -303,6 +369,12 @@ class ElementSequenceDataTypeDefinition(StorageDataTypeDefinition):
 
   _IS_COMPOSITE: 'bool' = True
 
+  __slots__ = (
+      'elements_data_size', 'elements_data_size_expression',
+      'element_data_type', 'element_data_type_definition',
+      'elements_terminator', 'number_of_elements',
+      'number_of_elements_expression')
+
   def __init__(
       self, name: 'str', data_type_definition: 'DataTypeDefinition',
       aliases: 'Optional[List[str]]' = None,
@@ -360,12 +432,16 @@ class SequenceDefinition(ElementSequenceDataTypeDefinition):
 
   TYPE_INDICATOR: 'Union[str, None]' = definitions.TYPE_INDICATOR_SEQUENCE
 
+  __slots__ = ()
+
 
 class StreamDefinition(ElementSequenceDataTypeDefinition):
   """Stream data type definition."""
 
   TYPE_INDICATOR: 'Union[str, None]' = definitions.TYPE_INDICATOR_STREAM
 
+  __slots__ = ()
+
 
 class StringDefinition(ElementSequenceDataTypeDefinition):
   """String data type definition.
@@ -376,6 +452,8 @@ class StringDefinition(ElementSequenceDataTypeDefinition):
 
   TYPE_INDICATOR: 'Union[str, None]' = definitions.TYPE_INDICATOR_STRING
 
+  __slots__ = ('encoding',)
+
   def __init__(
       self, name: 'str', data_type_definition: 'DataTypeDefinition',
       aliases: 'Optional[List[str]]' = None,
@@ -413,6 +491,10 @@ class DataTypeDefinitionWithMembers(StorageDataTypeDefinition):
 
   _IS_COMPOSITE: 'bool' = True
 
+  __slots__ = (
+      '_attribute_names', '_byte_size', '_member_byte_sizes', 'members',
+      'sections')
+
   def __init__(
       self, name: 'str', aliases: 'Optional[List[str]]' = None,
       description: 'Optional[str]' = None,
@@ -427,10 +509,31 @@ class DataTypeDefinitionWithMembers(StorageDataTypeDefinition):
     """
     super(DataTypeDefinitionWithMembers, self).__init__(
         name, aliases=aliases, description=description, urls=urls)
+    self._attribute_names: 'Union[Tuple[str, ...], None]' = None
     self._byte_size: 'Union[int, None]' = None
+    self._member_byte_sizes: 'Union[List[int], None]' = None
     self.members: 'List[DataTypeDefinition]' = []
     self.sections: 'List[MemberSectionDefinition]' = []
 
+  def _GetMemberByteSizes(self) -> 'List[int]':
+    """Retrieves the byte sizes of the members.
+
+    Returns:
+      list[int]: byte sizes of the members or an empty list if the size of
+          a member cannot be determined, for example for padding.
+    """
+    if self._member_byte_sizes is None:
+      self._member_byte_sizes = []
+      for member_definition in self.members:
+        byte_size = member_definition.GetByteSize()
+        if byte_size is None:
+          self._member_byte_sizes = []
+          break
+
+        self._member_byte_sizes.append(byte_size)
+
+    return self._member_byte_sizes
+
   def AddMemberDefinition(
       self, member_definition: 'DataTypeDefinition') -> 'None':
     """Adds a member definition.
@@ -438,7 +541,9 @@ class DataTypeDefinitionWithMembers(StorageDataTypeDefinition):
     Args:
       member_definition (DataTypeDefinition): member data type definition.
     """
+    self._attribute_names = None
     self._byte_size = None
+    self._member_byte_sizes = None
     self.members.append(member_definition)
 
     if self.sections:
@@ -454,13 +559,28 @@ class DataTypeDefinitionWithMembers(StorageDataTypeDefinition):
     """
     self.sections.append(section_definition)
 
-  @abc.abstractmethod
+  def GetAttributeNames(self) -> 'Tuple[str, ...]':
+    """Determines the attribute (or field) names of the members.
+
+    Returns:
+      tuple[str]: attribute names.
+    """
+    if self._attribute_names is None:
+      self._attribute_names = tuple(
+          member_definition.name for member_definition in self.members)
+
+    return self._attribute_names
+
   def GetByteSize(self) -> 'Union[int, None]':
     """Retrieves the byte size of the data type definition.
 
     Returns:
       int: data type size in bytes or None if size cannot be determined.
+
+    Raises:
+      NotImplementedError: if the subclass does not implement the method.
     """
+    raise NotImplementedError()
 
 
 class MemberDataTypeDefinition(StorageDataTypeDefinition):
@@ -472,8 +592,15 @@ class MemberDataTypeDefinition(StorageDataTypeDefinition):
     member_data_type_definition (DataTypeDefinition): member data type
         definition.
     values (list[int|str]): supported values.
+
+  The member data type definition is not expected to change after
+  the member data type definition has been initialized.
   """
 
+  __slots__ = (
+      '_is_composite', 'condition', 'member_data_type',
+      'member_data_type_definition', 'values')
+
   def __init__(
       self, name: 'str', data_type_definition: 'DataTypeDefinition',
       aliases: 'Optional[List[str]]' = None, condition: 'Optional[str]' = None,
@@ -496,6 +623,8 @@ class MemberDataTypeDefinition(StorageDataTypeDefinition):
     """
     super(MemberDataTypeDefinition, self).__init__(
         name, aliases=aliases, description=description, urls=urls)
+    self._is_composite: 'bool' = bool(
+        data_type_definition and data_type_definition.IsComposite())
     self.byte_order: 'str' = getattr(
         data_type_definition, 'byte_order', definitions.BYTE_ORDER_NATIVE)
     self.condition: 'Union[str, None]' = condition
@@ -523,9 +652,7 @@ class MemberDataTypeDefinition(StorageDataTypeDefinition):
     Returns:
       bool: True if the data type is composite, False otherwise.
     """
-    return bool(self.condition) or bool(
-        self.member_data_type_definition and
-        self.member_data_type_definition.IsComposite())
+    return bool(self.condition) or self._is_composite
 
 
 class MemberSectionDefinition(object):
@@ -536,6 +663,8 @@ class MemberSectionDefinition(object):
         the section.
   """
 
+  __slots__ = ('members', 'name')
+
   def __init__(self, name: 'str') -> 'None':
     """Initializes a member section definition.
 
@@ -557,6 +686,8 @@ class StructureDefinition(DataTypeDefinitionWithMembers):
 
   TYPE_INDICATOR: 'Union[str, None]' = definitions.TYPE_INDICATOR_STRUCTURE
 
+  __slots__ = ('family_definition',)
+
   def __init__(
       self, name: 'str', aliases: 'Optional[List[str]]' = None,
       description: 'Optional[str]' = None,
@@ -580,20 +711,29 @@ class StructureDefinition(DataTypeDefinitionWithMembers):
       int: data type size in bytes or None if size cannot be determined.
     """
     if self._byte_size is None and self.members:
+      member_byte_sizes = self._GetMemberByteSizes()
+      if member_byte_sizes:
+        self._byte_size = sum(member_byte_sizes)
+        return self._byte_size
+
       self._byte_size = 0
       for member_definition in self.members:
-        if (not isinstance(member_definition, PaddingDefinition) or
-            not member_definition.alignment_size):
+        alignment_size = None
+        if member_definition.TYPE_INDICATOR is (
+            definitions.TYPE_INDICATOR_PADDING):
+          alignment_size = typing.cast(
+              'PaddingDefinition', member_definition).alignment_size
+
+        if not alignment_size:
           byte_size = member_definition.GetByteSize()
           if byte_size is None:
             self._byte_size = None
             break
 
         else:
-          _, byte_size = divmod(
-              self._byte_size, member_definition.alignment_size)
+          _, byte_size = divmod(self._byte_size, alignment_size)
           if byte_size > 0:
-            byte_size = member_definition.alignment_size - byte_size
+            byte_size = alignment_size - byte_size
 
         self._byte_size += byte_size
 
@@ -605,6 +745,8 @@ class UnionDefinition(DataTypeDefinitionWithMembers):
 
   TYPE_INDICATOR: 'Union[str, None]' = definitions.TYPE_INDICATOR_UNION
 
+  __slots__ = ()
+
   def GetByteSize(self) -> 'Union[int, None]':
     """Retrieves the byte size of the data type definition.
 
@@ -612,14 +754,9 @@ class UnionDefinition(DataTypeDefinitionWithMembers):
       int: data type size in bytes or None if size cannot be determined.
     """
     if self._byte_size is None and self.members:
-      self._byte_size = 0
-      for member_definition in self.members:
-        byte_size = member_definition.GetByteSize()
-        if byte_size is None:
-          self._byte_size = None
-          break
-
-        self._byte_size = max(self._byte_size, byte_size)
+      member_byte_sizes = self._GetMemberByteSizes()
+      if member_byte_sizes:
+        self._byte_size = max(member_byte_sizes)
 
     return self._byte_size
 
@@ -635,6 +772,8 @@ class SemanticDataTypeDefinition(DataTypeDefinition):
   # methods.
   # pylint: disable=redundant-returns-doc
 
+  __slots__ = ()
+
   def GetByteSize(self) -> 'Union[int, None]':
     """Retrieves the byte size of the data type definition.
 
@@ -653,6 +792,8 @@ class ConstantDefinition(SemanticDataTypeDefinition):
 
   TYPE_INDICATOR: 'Union[str, None]' = definitions.TYPE_INDICATOR_CONSTANT
 
+  __slots__ = ('value',)
+
   def __init__(
       self, name: 'str', aliases: 'Optional[List[str]]' = None,
       description: 'Optional[str]' = None,
@@ -674,12 +815,14 @@ class EnumerationValue(object):
   """Enumeration value.
 
   Attributes:
-    aliases (list[str]): aliases.
+    aliases (Sequence[str]): aliases, an empty tuple if not defined.
     description (str): description.
     name (str): name.
     number (int): number.
   """
 
+  __slots__ = ('aliases', 'description', 'name', 'number')
+
   def __init__(
       self, name: 'str', number: 'int',
       aliases: 'Optional[List[str]]' = None,
@@ -693,7 +836,7 @@ class EnumerationValue(object):
       description (Optional[str]): description.
     """
     super(EnumerationValue, self).__init__()
-    self.aliases: 'List[str]' = aliases or []
+    self.aliases: 'Sequence[str]' = aliases if aliases else _EMPTY_TUPLE
     self.description: 'Union[str, None]' = description
     self.name: 'str' = name
     self.number: 'int' = number
@@ -714,6 +857,9 @@ class EnumerationDefinition(SemanticDataTypeDefinition):
   TYPE_INDICATOR: 'Union[str, None]' = (
       definitions.TYPE_INDICATOR_ENUMERATION)
 
+  __slots__ = (
+      'values', 'values_per_alias', 'values_per_name', 'values_per_number')
+
   def __init__(
       self, name: 'str', aliases: 'Optional[List[str]]' = None,
       description: 'Optional[str]' = None,
@@ -733,6 +879,23 @@ class EnumerationDefinition(SemanticDataTypeDefinition):
     self.values_per_name: 'Dict[str, EnumerationValue]' = {}
     self.values_per_number: 'Dict[int, EnumerationValue]' = {}
 
+  def _InternName(self, name: 'str') -> 'str':
+    """Interns an enumeration value name.
+
+    Names read from YAML are not guaranteed to be strings, other names are
+    returned as-is.
+
+    Args:
+      name (str): name.
+
+    Returns:
+      str: interned name.
+    """
+    if isinstance(name, str):
+      return sys.intern(name)
+
+    return name
+
   def AddValue(
       self, name: 'str', number: 'int', aliases: 'Optional[List[str]]' = None,
       description: 'Optional[str]' = None) -> 'None':
@@ -747,13 +910,15 @@ class EnumerationDefinition(SemanticDataTypeDefinition):
     Raises:
       KeyError: if the enumeration value already exists.
     """
+    name = self._InternName(name)
+
     if name in self.values_per_name:
       raise KeyError('Value with name: {0:s} already exists.'.format(name))
 
     if number in self.values_per_number:
       raise KeyError('Value with number: {0!s} already exists.'.format(number))
 
-    for alias in aliases or []:
+    for alias in aliases or _EMPTY_TUPLE:
       if alias in self.values_per_alias:
         raise KeyError('Value with alias: {0:s} already exists.'.format(alias))
 
@@ -764,9 +929,57 @@ class EnumerationDefinition(SemanticDataTypeDefinition):
     self.values_per_name[name] = enumeration_value
     self.values_per_number[number] = enumeration_value
 
-    for alias in aliases or []:
+    for alias in aliases or _EMPTY_TUPLE:
       self.values_per_alias[alias] = enumeration_value
 
+  def BulkAddValues(
+      self,
+      values: 'Iterable[Tuple[str, int, Optional[List[str]], Optional[str]]]'
+      ) -> 'None':
+    """Adds multiple enumeration values.
+
+    The values are only added if none of them conflicts with an existing value
+    or with another value being added.
+
+    Args:
+      values (Iterable[tuple[str, int, list[str], str]]): name, number,
+          aliases and description of each enumeration value.
+
+    Raises:
+      KeyError: if an enumeration value already exists.
+    """
+    enumeration_values = [
+        EnumerationValue(
+            self._InternName(name), number, aliases=aliases,
+            description=description)
+        for name, number, aliases, description in values]
+
+    names = [value.name for value in enumeration_values]
+    numbers = [value.number for value in enumeration_values]
+    aliases = [
+        alias for value in enumeration_values for alias in value.aliases]
+
+    for keys, existing_keys, key_type in (
+        (names, self.values_per_name, 'name'),
+        (numbers, self.values_per_number, 'number'),
+        (aliases, self.values_per_alias, 'alias')):
+      unique_keys = set(keys)
+      if (len(unique_keys) != len(keys) or
+          not unique_keys.isdisjoint(existing_keys)):
+        seen_keys = set(existing_keys)
+        for key in keys:
+          if key in seen_keys:
+            raise KeyError('Value with {0:s}: {1!s} already exists.'.format(
+                key_type, key))
+          seen_keys.add(key)
+
+    self.values.extend(enumeration_values)
+    self.values_per_name.update(zip(names, enumeration_values))
+    self.values_per_number.update(zip(numbers, enumeration_values))
+    self.values_per_alias.update(
+        (alias, value) for value in enumeration_values
+        for alias in value.aliases)
+
 
 class LayoutDataTypeDefinition(DataTypeDefinition):
   """Layout data type definition interface."""
@@ -777,6 +990,8 @@ class LayoutDataTypeDefinition(DataTypeDefinition):
 
   _IS_COMPOSITE: 'bool' = True
 
+  __slots__ = ()
+
   def GetByteSize(self) -> 'Union[int, None]':
     """Retrieves the byte size of the data type definition.
 
@@ -795,6 +1010,8 @@ class FormatDefinition(LayoutDataTypeDefinition):
 
   TYPE_INDICATOR: 'Union[str, None]' = definitions.TYPE_INDICATOR_FORMAT
 
+  __slots__ = ('metadata',)
+
   def __init__(
       self, name: 'str', aliases: 'Optional[List[str]]' = None,
       description: 'Optional[str]' = None,
@@ -823,6 +1040,8 @@ class StructureFamilyDefinition(LayoutDataTypeDefinition):
   TYPE_INDICATOR: 'Union[str, None]' = (
       definitions.TYPE_INDICATOR_STRUCTURE_FAMILY)
 
+  __slots__ = ('members', 'runtime')
+
   def __init__(
       self, name: 'str', aliases: 'Optional[List[str]]' = None,
       description: 'Optional[str]' = None,
@@ -859,3 +1078,13 @@ class StructureFamilyDefinition(LayoutDataTypeDefinition):
     """
     self.runtime = runtime_definition
     runtime_definition.family_definition = self
+
+
+TYPE_INDICATOR_TO_CLASS: 'Dict[Optional[str], type]' = {
+    data_type_class.TYPE_INDICATOR: data_type_class
+    for data_type_class in (
+        BooleanDefinition, CharacterDefinition, ConstantDefinition,
+        EnumerationDefinition, FloatingPointDefinition, FormatDefinition,
+        IntegerDefinition, PaddingDefinition, SequenceDefinition,
+        StreamDefinition, StringDefinition, StructureDefinition,
+        StructureFamilyDefinition, UnionDefinition, UUIDDefinition)}
@@ -3,37 +3,39 @@
 
 from __future__ import unicode_literals
 
+import sys
 
-BYTE_ORDER_BIG_ENDIAN = 'big-endian'
-BYTE_ORDER_LITTLE_ENDIAN = 'little-endian'
-BYTE_ORDER_MIDDLE_ENDIAN = 'middle-endian'
-BYTE_ORDER_NATIVE = 'native'
+
+BYTE_ORDER_BIG_ENDIAN = sys.intern('big-endian')
+BYTE_ORDER_LITTLE_ENDIAN = sys.intern('little-endian')
+BYTE_ORDER_MIDDLE_ENDIAN = sys.intern('middle-endian')
+BYTE_ORDER_NATIVE = sys.intern('native')
 
 BYTE_ORDERS = frozenset([
     BYTE_ORDER_BIG_ENDIAN,
     BYTE_ORDER_LITTLE_ENDIAN,
     BYTE_ORDER_NATIVE])
 
-FORMAT_SIGNED = 'signed'
-FORMAT_UNSIGNED = 'unsigned'
-
-SIZE_NATIVE = 'native'
-
-TYPE_INDICATOR_BOOLEAN = 'boolean'
-TYPE_INDICATOR_CHARACTER = 'character'
-TYPE_INDICATOR_CONSTANT = 'constant'
-TYPE_INDICATOR_ENUMERATION = 'enumeration'
-TYPE_INDICATOR_FLOATING_POINT = 'floating-point'
-TYPE_INDICATOR_FORMAT = 'format'
-TYPE_INDICATOR_INTEGER = 'integer'
-TYPE_INDICATOR_PADDING = 'padding'
-TYPE_INDICATOR_SEQUENCE = 'sequence'
-TYPE_INDICATOR_STREAM = 'stream'
-TYPE_INDICATOR_STRING = 'string'
-TYPE_INDICATOR_STRUCTURE = 'structure'
-TYPE_INDICATOR_STRUCTURE_FAMILY = 'structure-family'
-TYPE_INDICATOR_UNION = 'union'
-TYPE_INDICATOR_UUID = 'uuid'
+FORMAT_SIGNED = sys.intern('signed')
+FORMAT_UNSIGNED = sys.intern('unsigned')
+
+SIZE_NATIVE = sys.intern('native')
+
+TYPE_INDICATOR_BOOLEAN = sys.intern('boolean')
+TYPE_INDICATOR_CHARACTER = sys.intern('character')
+TYPE_INDICATOR_CONSTANT = sys.intern('constant')
+TYPE_INDICATOR_ENUMERATION = sys.intern('enumeration')
+TYPE_INDICATOR_FLOATING_POINT = sys.intern('floating-point')
+TYPE_INDICATOR_FORMAT = sys.intern('format')
+TYPE_INDICATOR_INTEGER = sys.intern('integer')
+TYPE_INDICATOR_PADDING = sys.intern('padding')
+TYPE_INDICATOR_SEQUENCE = sys.intern('sequence')
+TYPE_INDICATOR_STREAM = sys.intern('stream')
+TYPE_INDICATOR_STRING = sys.intern('string')
+TYPE_INDICATOR_STRUCTURE = sys.intern('structure')
+TYPE_INDICATOR_STRUCTURE_FAMILY = sys.intern('structure-family')
+TYPE_INDICATOR_UNION = sys.intern('union')
+TYPE_INDICATOR_UUID = sys.intern('uuid')
 
 TYPE_INDICATORS = frozenset([
     TYPE_INDICATOR_BOOLEAN,
@@ -312,6 +312,7 @@ class DataTypeDefinitionsReader(object):
         data_types.EnumerationDefinition, definition_name,
         self._SUPPORTED_DEFINITION_VALUES_ENUMERATION)
 
+    enumeration_values = []
     last_name = None
     for enumeration_value in values:
       aliases = enumeration_value.get('aliases', None)
@@ -328,15 +329,15 @@ class DataTypeDefinitionsReader(object):
         error_message = '{0:s} missing name or number'.format(error_location)
         raise errors.DefinitionReaderError(definition_name, error_message)
 
-      try:
-        definition_object.AddValue(
-            name, number, aliases=aliases, description=description)
-      except KeyError as exception:
-        error_message = '{0!s}'.format(exception)
-        raise errors.DefinitionReaderError(definition_name, error_message)
-
+      enumeration_values.append((name, number, aliases, description))
       last_name = name
 
+    try:
+      definition_object.BulkAddValues(enumeration_values)
+    except KeyError as exception:
+      error_message = '{0!s}'.format(exception)
+      raise errors.DefinitionReaderError(definition_name, error_message)
+
     return definition_object
 
   def _ReadElementSequenceDataTypeDefinition(
@@ -400,7 +401,7 @@ class DataTypeDefinitionsReader(object):
 
     element_byte_size = element_data_type_definition.GetByteSize()
     element_type_indicator = element_data_type_definition.TYPE_INDICATOR
-    if not element_byte_size and element_type_indicator != (
+    if not element_byte_size and element_type_indicator is not (
         definitions.TYPE_INDICATOR_STRING):
       error_message = (
           'unsupported variable size element data type: {0:s}'.format(
@@ -94,9 +94,10 @@ class DataTypeDefinitionsRegistry(object):
         raise KeyError('Alias already set for name: {0:s}.'.format(alias))
 
     self._definitions[name_lower] = data_type_definition
+    data_type_definition.registered = True
 
     for alias in data_type_definition.aliases:
       self._aliases[alias] = name_lower
 
-    if data_type_definition.TYPE_INDICATOR == definitions.TYPE_INDICATOR_FORMAT:
+    if data_type_definition.TYPE_INDICATOR is definitions.TYPE_INDICATOR_FORMAT:
       self._format_definitions.append(name_lower)
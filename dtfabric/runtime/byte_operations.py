@@ -17,11 +17,12 @@ class ByteStreamOperation(object):
   # pylint: disable=redundant-returns-doc
 
   @abc.abstractmethod
-  def ReadFrom(self, byte_stream):
+  def ReadFrom(self, byte_stream, byte_offset=0):
     """Read values from a byte stream.
 
     Args:
       byte_stream (bytes): byte stream.
+      byte_offset (Optional[int]): offset into the byte stream where to start.
 
     Returns:
       tuple[object, ...]: values copies from the byte stream.
@@ -63,11 +64,12 @@ class StructOperation(ByteStreamOperation):
     self._struct = struct_object
     self._struct_format_string = format_string
 
-  def ReadFrom(self, byte_stream):
+  def ReadFrom(self, byte_stream, byte_offset=0):
     """Read values from a byte stream.
 
     Args:
       byte_stream (bytes): byte stream.
+      byte_offset (Optional[int]): offset into the byte stream where to start.
 
     Returns:
       tuple[object, ...]: values copies from the byte stream.
@@ -77,7 +79,7 @@ class StructOperation(ByteStreamOperation):
       OSError: if byte stream cannot be read.
     """
     try:
-      return self._struct.unpack_from(byte_stream)
+      return self._struct.unpack_from(byte_stream, offset=byte_offset)
     except (TypeError, struct.error) as exception:
       raise IOError('Unable to read byte stream with error: {0!s}'.format(
           exception))
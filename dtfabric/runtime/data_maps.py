@@ -307,7 +307,8 @@ class PrimitiveDataTypeMap(StorageDataTypeMap):
     self._CheckByteStreamSize(byte_stream, byte_offset, data_type_size)
 
     try:
-      struct_tuple = self._operation.ReadFrom(byte_stream[byte_offset:])
+      struct_tuple = self._operation.ReadFrom(
+          byte_stream, byte_offset=byte_offset)
       mapped_value = self.MapValue(*struct_tuple)
 
     except Exception as exception:
@@ -1072,7 +1073,8 @@ class SequenceMap(ElementSequenceDataTypeMap):
     self._CheckByteStreamSize(byte_stream, byte_offset, elements_data_size)
 
     try:
-      struct_tuple = self._operation.ReadFrom(byte_stream[byte_offset:])
+      struct_tuple = self._operation.ReadFrom(
+          byte_stream, byte_offset=byte_offset)
       mapped_values = map(self._element_data_type_map.MapValue, struct_tuple)
 
     except Exception as exception:
@@ -1638,7 +1640,8 @@ class StructureMap(StorageDataTypeMap):
         if not condition_result:
           continue
 
-      if isinstance(member_definition, data_types.PaddingDefinition):
+      if member_definition.TYPE_INDICATOR is (
+          definitions.TYPE_INDICATOR_PADDING):
         _, byte_size = divmod(
             members_data_size, member_definition.alignment_size)
         if byte_size > 0:
@@ -1694,7 +1697,7 @@ class StructureMap(StorageDataTypeMap):
       data_type_definition (DataTypeDefinition): data type definition.
 
     Returns:
-      list[str]: attribute names.
+      tuple[str]: attribute names.
 
     Raises:
       FormatError: if the attribute names cannot be determined from the data
@@ -1703,11 +1706,7 @@ class StructureMap(StorageDataTypeMap):
     if not data_type_definition:
       raise errors.FormatError('Missing data type definition')
 
-    attribute_names = []
-    for member_definition in data_type_definition.members:
-      attribute_names.append(member_definition.name)
-
-    return attribute_names
+    return data_type_definition.GetAttributeNames()
 
   def _GetMemberDataTypeMaps(self, data_type_definition, data_type_map_cache):
     """Retrieves the member data type maps.
@@ -1744,6 +1743,8 @@ class StructureMap(StorageDataTypeMap):
         member_definition = copy.copy(member_definition)
         member_definition.name = '_{0:s}_{1:s}'.format(
             data_type_definition.name, member_definition.name)
+        # The copy is not the registered definition.
+        member_definition.registered = False
         member_definition.byte_order = data_type_definition.byte_order
 
       if member_definition.name not in data_type_map_cache:
@@ -1753,7 +1754,8 @@ class StructureMap(StorageDataTypeMap):
 
       data_type_map = data_type_map_cache[member_definition.name]
       if members_data_size is not None:
-        if not isinstance(member_definition, data_types.PaddingDefinition):
+        if member_definition.TYPE_INDICATOR is not (
+            definitions.TYPE_INDICATOR_PADDING):
           byte_size = member_definition.GetByteSize()
         else:
           _, byte_size = divmod(
@@ -1819,7 +1821,8 @@ class StructureMap(StorageDataTypeMap):
     self._CheckByteStreamSize(byte_stream, byte_offset, members_data_size)
 
     try:
-      struct_tuple = self._operation.ReadFrom(byte_stream[byte_offset:])
+      struct_tuple = self._operation.ReadFrom(
+          byte_stream, byte_offset=byte_offset)
       struct_values = []
       for attribute_index, value in enumerate(struct_tuple):
         data_type_map = self._data_type_maps[attribute_index]
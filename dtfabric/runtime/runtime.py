@@ -73,7 +73,7 @@ class StructureValuesClassFactory(object):
         member_definition = member_definition.member_data_type_definition
 
       member_type_indicator = member_definition.TYPE_INDICATOR
-      if member_type_indicator == definitions.TYPE_INDICATOR_SEQUENCE:
+      if member_type_indicator is definitions.TYPE_INDICATOR_SEQUENCE:
         element_type_indicator = member_definition.element_data_type
         member_type_indicator = 'tuple[{0:s}]'.format(element_type_indicator)
       else:
@@ -3,6 +3,7 @@
 
 from __future__ import unicode_literals
 
+import sys
 import unittest
 
 from dtfabric import data_types
@@ -14,6 +15,42 @@ from tests import test_lib
 class DataTypeDefinitionTest(test_lib.BaseTestCase):
   """Data type definition tests."""
 
+  def testEqualAndHash(self):
+    """Tests the __eq__ and __hash__ functions."""
+    data_type_definition1 = data_types.IntegerDefinition('int32')
+    data_type_definition2 = data_types.IntegerDefinition('int32')
+    data_type_definition3 = data_types.IntegerDefinition('uint32')
+    data_type_definition4 = data_types.BooleanDefinition('int32')
+
+    # Definitions that are not registered are only equal to themselves.
+    self.assertEqual(data_type_definition1, data_type_definition1)
+    self.assertNotEqual(data_type_definition1, data_type_definition2)
+    self.assertEqual(hash(data_type_definition1), hash(data_type_definition2))
+
+    for data_type_definition in (
+        data_type_definition1, data_type_definition2, data_type_definition3,
+        data_type_definition4):
+      data_type_definition.registered = True
+
+    self.assertEqual(data_type_definition1, data_type_definition2)
+    self.assertNotEqual(data_type_definition1, data_type_definition3)
+    self.assertNotEqual(data_type_definition1, data_type_definition4)
+    self.assertNotEqual(data_type_definition1, 'int32')
+
+    # The hash follows the name of the definition.
+    data_type_definition2.name = 'uint32'
+    self.assertEqual(hash(data_type_definition2), hash(data_type_definition3))
+    self.assertEqual(data_type_definition2, data_type_definition3)
+
+    # Members with the same name in different structures are not equal.
+    member_definition1 = data_types.MemberDataTypeDefinition(
+        'size', data_type_definition1)
+    member_definition2 = data_types.MemberDataTypeDefinition(
+        'size', data_types.StructureDefinition('my_struct_type'))
+
+    self.assertNotEqual(member_definition1, member_definition2)
+    self.assertEqual(len(set([member_definition1, member_definition2])), 2)
+
   def testIsComposite(self):
     """Tests the IsComposite function."""
     data_type_definition = data_types.DataTypeDefinition(
@@ -58,6 +95,14 @@ class FixedSizeDataTypeDefinitionTest(test_lib.BaseTestCase):
     byte_size = data_type_definition.GetByteSize()
     self.assertEqual(byte_size, 4)
 
+    data_type_definition.size = 2
+    byte_size = data_type_definition.GetByteSize()
+    self.assertEqual(byte_size, 2)
+
+    data_type_definition.units = 'bits'
+    byte_size = data_type_definition.GetByteSize()
+    self.assertIsNone(byte_size)
+
 
 class BooleanDefinitionTest(test_lib.BaseTestCase):
   """Boolean data type definition tests."""
@@ -87,6 +132,18 @@ class IntegerDefinitionTest(test_lib.BaseTestCase):
         description='signed 32-bit integer')
     self.assertIsNotNone(data_type_definition)
 
+  def testSlots(self):
+    """Tests that the definition does not have an instance dictionary."""
+    data_type_definition = data_types.IntegerDefinition(
+        'int32', aliases=['LONG', 'LONG32'],
+        description='signed 32-bit integer')
+
+    self.assertFalse(hasattr(data_type_definition, '__dict__'))
+
+    # pylint: disable=assigning-non-slot
+    with self.assertRaises(AttributeError):
+      data_type_definition.bogus = True
+
 
 class UUIDDefinitionTest(test_lib.BaseTestCase):
   """UUID data type definition tests."""
@@ -137,6 +194,11 @@ class ElementSequenceDataTypeDefinitionTest(test_lib.BaseTestCase):
     byte_size = data_type_definition.GetByteSize()
     self.assertEqual(byte_size, 128)
 
+    # Test that the byte size follows changes of the element byte size.
+    element_definition.size = 2
+    byte_size = data_type_definition.GetByteSize()
+    self.assertEqual(byte_size, 64)
+
     data_type_definition.elements_data_size = 128
     data_type_definition.number_of_elements = 0
     byte_size = data_type_definition.GetByteSize()
@@ -260,6 +322,18 @@ class MemberDataTypeDefinitionTest(test_lib.BaseTestCase):
     result = data_type_definition.IsComposite()
     self.assertTrue(result)
 
+    data_type_definition.condition = None
+    result = data_type_definition.IsComposite()
+    self.assertFalse(result)
+
+    data_type_definition = data_types.MemberDataTypeDefinition(
+        'my_struct_member', data_types.UUIDDefinition('guid'),
+        aliases=['MY_STRUCT_MEMBER'], data_type='guid',
+        description='my structure member')
+
+    result = data_type_definition.IsComposite()
+    self.assertTrue(result)
+
 
 class MemberSectionDefinitionTest(test_lib.BaseTestCase):
   """Member section definition tests."""
@@ -274,6 +348,84 @@ class MemberSectionDefinitionTest(test_lib.BaseTestCase):
 class StructureDefinitionTest(test_lib.BaseTestCase):
   """Structure data type definition tests."""
 
+  # pylint: disable=protected-access
+
+  def testGetByteSizeWithMemberByteSizes(self):
+    """Tests the GetByteSize function with member byte sizes."""
+    data_type_definition = data_types.StructureDefinition('my_struct_type')
+
+    for name, size in (('member1', 4), ('member2', 2)):
+      member_definition = data_types.IntegerDefinition(name)
+      member_definition.size = size
+      data_type_definition.AddMemberDefinition(member_definition)
+
+    # Test that the byte sizes of the members are determined when the byte
+    # size is first retrieved.
+    self.assertIsNone(data_type_definition._member_byte_sizes)
+    member_definition.size = 8
+
+    byte_size = data_type_definition.GetByteSize()
+    self.assertEqual(byte_size, 12)
+    self.assertEqual(data_type_definition._member_byte_sizes, [4, 8])
+
+  def testGetByteSizeWithPadding(self):
+    """Tests the GetByteSize function with a padding member."""
+    data_type_definition = data_types.StructureDefinition('my_struct_type')
+
+    member_definition = data_types.IntegerDefinition('member1')
+    member_definition.size = 2
+    data_type_definition.AddMemberDefinition(member_definition)
+
+    padding_definition = data_types.PaddingDefinition(
+        'padding1', alignment_size=8)
+    data_type_definition.AddMemberDefinition(padding_definition)
+
+    member_definition = data_types.IntegerDefinition('member2')
+    member_definition.size = 4
+    data_type_definition.AddMemberDefinition(member_definition)
+
+    byte_size = data_type_definition.GetByteSize()
+    self.assertEqual(byte_size, 12)
+    self.assertEqual(data_type_definition._member_byte_sizes, [])
+
+  def testGetByteSizeWithCondition(self):
+    """Tests the GetByteSize function with a conditional member."""
+    data_type_definition = data_types.StructureDefinition('my_struct_type')
+
+    member_definition = data_types.IntegerDefinition('int32')
+    member_definition.size = 4
+
+    structure_member_definition = data_types.MemberDataTypeDefinition(
+        'member1', member_definition)
+    data_type_definition.AddMemberDefinition(structure_member_definition)
+
+    structure_member_definition = data_types.MemberDataTypeDefinition(
+        'member2', member_definition, condition='my_struct_type.member1 > 0')
+    data_type_definition.AddMemberDefinition(structure_member_definition)
+
+    byte_size = data_type_definition.GetByteSize()
+    self.assertIsNone(byte_size)
+    self.assertEqual(data_type_definition._member_byte_sizes, [])
+
+  def testGetAttributeNames(self):
+    """Tests the GetAttributeNames function."""
+    data_type_definition = data_types.StructureDefinition(
+        'my_struct_type', aliases=['MY_STRUCT_TYPE'],
+        description='my structure type')
+
+    attribute_names = data_type_definition.GetAttributeNames()
+    self.assertEqual(attribute_names, ())
+
+    member_definition = data_types.IntegerDefinition('int32')
+    structure_member_definition = data_types.MemberDataTypeDefinition(
+        'my_struct_member', member_definition, aliases=['MY_STRUCT_MEMBER'],
+        data_type='int32', description='my structure member')
+
+    data_type_definition.AddMemberDefinition(structure_member_definition)
+
+    attribute_names = data_type_definition.GetAttributeNames()
+    self.assertEqual(attribute_names, ('my_struct_member',))
+
   @test_lib.skipUnlessHasTestFile(['structure.yaml'])
   def testGetByteSize(self):
     """Tests the GetByteSize function."""
@@ -355,6 +507,24 @@ class UnionDefinitionTest(test_lib.BaseTestCase):
 
     # TODO: test member_definition.GetByteSize() returns None
 
+  def testGetByteSizeWithMemberByteSizes(self):
+    """Tests the GetByteSize function with member byte sizes."""
+    data_type_definition = data_types.UnionDefinition('my_union_type')
+
+    for name, size in (('member1', 2), ('member2', 8), ('member3', 4)):
+      member_definition = data_types.IntegerDefinition(name)
+      member_definition.size = size
+      data_type_definition.AddMemberDefinition(member_definition)
+
+    byte_size = data_type_definition.GetByteSize()
+    self.assertEqual(byte_size, 8)
+
+    member_definition = data_types.IntegerDefinition('member4')
+    data_type_definition.AddMemberDefinition(member_definition)
+
+    byte_size = data_type_definition.GetByteSize()
+    self.assertIsNone(byte_size)
+
   def testIsComposite(self):
     """Tests the IsComposite function."""
     data_type_definition = data_types.UnionDefinition(
@@ -423,6 +593,59 @@ class EnumerationDefinitionTest(test_lib.BaseTestCase):
     with self.assertRaises(KeyError):
       data_type_definition.AddValue('myenum', 7, aliases=['value5'])
 
+    data_type_definition.AddValue(8, 8)
+    self.assertIn(8, data_type_definition.values_per_name)
+
+    # Test that a name built at runtime is interned.
+    data_type_definition.AddValue(''.join(['enum_', 'value3']), 3)
+    enumeration_value = data_type_definition.values[-1]
+    self.assertIs(enumeration_value.name, sys.intern('enum_value3'))
+
+    name = list(data_type_definition.values_per_name.keys())[-1]
+    self.assertIs(name, sys.intern('enum_value3'))
+
+  def testBulkAddValues(self):
+    """Tests the BulkAddValues function."""
+    data_type_definition = data_types.EnumerationDefinition(
+        'enum', description='enumeration')
+
+    data_type_definition.BulkAddValues([
+        ('enum_value', 5, ['value5'], None),
+        ('enum_value2', 6, None, 'description')])
+
+    self.assertEqual(len(data_type_definition.values), 2)
+    self.assertIn('enum_value2', data_type_definition.values_per_name)
+    self.assertIn(6, data_type_definition.values_per_number)
+    self.assertIn('value5', data_type_definition.values_per_alias)
+
+    with self.assertRaises(KeyError):
+      data_type_definition.BulkAddValues([('enum_value', 7, ['value7'], None)])
+
+    with self.assertRaises(KeyError):
+      data_type_definition.BulkAddValues([
+          ('myenum', 7, None, None), ('myenum', 8, None, None)])
+
+    with self.assertRaises(KeyError):
+      data_type_definition.BulkAddValues([
+          ('myenum', 7, None, None), ('myenum2', 7, None, None)])
+
+    with self.assertRaises(KeyError):
+      data_type_definition.BulkAddValues([('myenum', 7, ['value5'], None)])
+
+    self.assertEqual(len(data_type_definition.values), 2)
+
+    data_type_definition.BulkAddValues([(9, 9, None, None)])
+    self.assertIn(9, data_type_definition.values_per_name)
+
+    # Test that a name built at runtime is interned.
+    data_type_definition.BulkAddValues([
+        (''.join(['enum_', 'value3']), 3, None, None)])
+    enumeration_value = data_type_definition.values[-1]
+    self.assertIs(enumeration_value.name, sys.intern('enum_value3'))
+
+    name = list(data_type_definition.values_per_name.keys())[-1]
+    self.assertIs(name, sys.intern('enum_value3'))
+
 
 class LayoutDataTypeDefinitionTest(test_lib.BaseTestCase):
   """Layout data type definition tests."""
@@ -469,5 +692,19 @@ class StructureFamilyDefinitionTest(test_lib.BaseTestCase):
   # TODO: add tests for AddRuntimeDefinition
 
 
+class TypeIndicatorToClassTest(test_lib.BaseTestCase):
+  """Type indicator to data type definition class mapping tests."""
+
+  def testMapping(self):
+    """Tests the TYPE_INDICATOR_TO_CLASS mapping."""
+    self.assertEqual(
+        set(data_types.TYPE_INDICATOR_TO_CLASS.keys()),
+        definitions.TYPE_INDICATORS)
+
+    for type_indicator, data_type_class in (
+        data_types.TYPE_INDICATOR_TO_CLASS.items()):
+      self.assertEqual(data_type_class.TYPE_INDICATOR, type_indicator)
+
+
 if __name__ == '__main__':
   unittest.main()
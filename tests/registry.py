@@ -22,7 +22,10 @@ class DataTypeDefinitionsRegistryTest(test_lib.BaseTestCase):
         'int32', aliases=['LONG', 'LONG32'],
         description='signed 32-bit integer')
 
+    self.assertFalse(data_type_definition.registered)
+
     definitions_registry.RegisterDefinition(data_type_definition)
+    self.assertTrue(data_type_definition.registered)
 
     with self.assertRaises(KeyError):
       definitions_registry.RegisterDefinition(data_type_definition)
@@ -32,6 +32,10 @@ class StructOperationTest(test_lib.BaseTestCase):
     value = byte_stream_operation.ReadFrom(b'\x12\x34\x56\x78')
     self.assertEqual(value, tuple([0x78563412]))
 
+    value = byte_stream_operation.ReadFrom(
+        b'\xff\x12\x34\x56\x78', byte_offset=1)
+    self.assertEqual(value, tuple([0x78563412]))
+
     with self.assertRaises(IOError):
       byte_stream_operation.ReadFrom(None)
 
@@ -1121,7 +1121,7 @@ class StructureMapTest(test_lib.BaseTestCase):
 
     data_type_map = data_maps.StructureMap(data_type_definition)
     attribute_names = data_type_map._GetAttributeNames(data_type_definition)
-    self.assertEqual(attribute_names, ['x', 'y', 'z'])
+    self.assertEqual(attribute_names, ('x', 'y', 'z'))
 
     with self.assertRaises(errors.FormatError):
       data_type_map._GetAttributeNames(None)
@@ -1140,6 +1140,14 @@ class StructureMapTest(test_lib.BaseTestCase):
         data_type_definition, {})
     self.assertIsNotNone(members_data_type_maps)
 
+    # The members use a copy of the registered int32 definition with
+    # the byte-order of the structure.
+    member_definition = members_data_type_maps[0]._data_type_definition
+    self.assertEqual(member_definition.name, '_point3d_int32')
+    self.assertFalse(member_definition.registered)
+    int32_definition = definitions_registry.GetDefinitionByName('int32')
+    self.assertTrue(int32_definition.registered)
+
     with self.assertRaises(errors.FormatError):
       data_type_map._GetMemberDataTypeMaps(None, {})
 